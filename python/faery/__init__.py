@@ -6,6 +6,7 @@ import numpy
 from .decoder import Decoder
 from .stream import DVS_DTYPE as DVS_DTYPE
 from .stream import Array as Array
+from .stream import Chain as Chain
 from .stream import Stream as Stream
 from .stream import TimestampOffset as TimestampOffset
 
@@ -13,10 +14,53 @@ from .stream import TimestampOffset as TimestampOffset
 def stream_from_file(
     path: typing.Union[str, pathlib.Path],
     stream_id: typing.Optional[int] = None,
+    batch_size: int = 0,
+    prefetch: int = 2,
 ) -> Stream:
     if isinstance(path, str):
         path = pathlib.Path(path)
-    return Decoder(path=path, stream_id=stream_id)
+    return Decoder(
+        path=path, stream_id=stream_id, batch_size=batch_size, prefetch=prefetch
+    )
+
+
+def stream_from_files(
+    paths: typing.Sequence[typing.Union[str, pathlib.Path]],
+    stream_id: typing.Optional[int] = None,
+    batch_size: int = 0,
+    workers: int = 2,
+    prefetch: int = 16,
+    offset_timestamps: bool = False,
+) -> Stream:
+    """Decodes files one after the other as a single stream.
+
+    The next workers files are decoded concurrently, each up to prefetch packets ahead of
+    the consumer. At most workers x prefetch decoded packets are buffered at once.
+
+    Args:
+        paths (typing.Sequence[typing.Union[str, pathlib.Path]]): Paths of the input event files, in order.
+        stream_id (typing.Optional[int], optional): Stream ID, only used with aedat files. Defaults to None.
+        batch_size (int, optional): Minimum number of events per yielded array. Defaults to 0.
+        workers (int, optional): Number of files decoded concurrently. Defaults to 2.
+        prefetch (int, optional): Maximum number of packets decoded ahead per file. Defaults to 16.
+        offset_timestamps (bool, optional): Rebase each file onto the previous file's last timestamp, for recordings that each start at zero. Defaults to False.
+
+    Returns:
+        Stream: The concatenated stream.
+    """
+    return Chain(
+        streams=[
+            stream_from_file(
+                path=path,
+                stream_id=stream_id,
+                batch_size=batch_size,
+                prefetch=prefetch,
+            )
+            for path in paths
+        ],
+        lookahead=workers,
+        offset_timestamps=offset_timestamps,
+    )
 
 
 def stream_from_array(events: numpy.ndarray) -> Stream:
@@ -1,6 +1,7 @@
 import enum
+import os
 import pathlib
-import types
+import struct
 import typing
 
 import numpy
@@ -9,58 +10,133 @@ TYPE_ES: int = 0
 TYPE_AEDAT: int = 1
 TYPE_RAW: int = 2
 
+SUFFIX_TO_TYPE: typing.Dict[str, int] = {
+    ".es": TYPE_ES,
+    ".aedat4": TYPE_AEDAT,
+}
+MAGIC_TO_TYPE: typing.Dict[bytes, int] = {
+    b"Event Stream": TYPE_ES,
+    b"#!AER-DAT4.0": TYPE_AEDAT,
+}
+LONGEST_MAGIC: int = max(len(magic) for magic in MAGIC_TO_TYPE.keys())
+EVENT_STREAM_HEADER_LENGTH: int = 20
+
 from . import stream
 
 
+def read_header(path: pathlib.Path, length: int) -> bytes:
+    """Reads up to length bytes from the start of a file with raw OS calls (no Python file object)."""
+    descriptor = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        return os.read(descriptor, length)
+    finally:
+        os.close(descriptor)
+
+
+def probe_event_stream_header(path: pathlib.Path) -> typing.Tuple[int, int]:
+    """Reads the dimensions of a DVS Event Stream file from its header.
+
+    This avoids constructing a full decoder (and its read buffer) when only the dimensions are needed.
+
+    Args:
+        path (pathlib.Path): Path of the input Event Stream file.
+
+    Raises:
+        Exception: if the file is not a version 2 DVS Event Stream file.
+
+    Returns:
+        typing.Tuple[int, int]: Width and height of the sensor.
+    """
+    header = read_header(path, EVENT_STREAM_HEADER_LENGTH)
+    if len(header) < EVENT_STREAM_HEADER_LENGTH or header[0:12] != b"Event Stream":
+        raise Exception(f"the file {path} is not an Event Stream file")
+    if header[12] != 2:
+        raise Exception(
+            f"unsupported Event Stream version {header[12]}.{header[13]}.{header[14]} in {path}"
+        )
+    if header[15] != 1:
+        raise Exception(f"the file {path} does not contain DVS events")
+    width, height = struct.unpack("<HH", header[16:20])
+    return (width, height)
+
+
 class DecoderIterator(stream.StreamIterator):
-    def __init__(self, type: int, stream_id: int, height: int, inner: typing.Iterable):
+    def __init__(
+        self,
+        type: int,
+        stream_id: int,
+        height: int,
+        inner: typing.Iterable,
+        batch_size: int = 0,
+        prefetch: int = 2,
+    ):
         super().__init__()
         self.type = type
         self.stream_id = stream_id
-        self.height = height
+        self.y_max = height - 1
+        type_to_next: typing.Dict[int, typing.Callable[[], numpy.ndarray]] = {
+            TYPE_ES: self.next_es,
+            TYPE_AEDAT: self.next_aedat,
+            TYPE_RAW: self.next_packet,
+        }
+        if type not in type_to_next:
+            raise Exception(f"type {type} not implemented")
+        self.next = type_to_next[type]
+        self.batch_size = batch_size
+        if self.batch_size > 0:
+            self.next_unbatched = self.next
+            self.next = self.next_batch
         self.inner = iter(inner)
+        self.packets = stream.PrefetchIterator(self.inner, maxsize=prefetch)
 
     def __next__(self) -> numpy.ndarray:
-        assert self.inner is not None
+        if self.inner is None:
+            raise StopIteration()
         try:
-            if self.type == TYPE_ES:
-                return self.inner.__next__()
-            elif self.type == TYPE_AEDAT:
-                while True:
-                    packet = self.inner.__next__()
-                    if (
-                        "events" in packet
-                        and packet["stream_id"] == self.stream_id
-                        and len(packet["events"]) > 0
-                    ):
-                        packet["events"]["y"] = self.height - 1 - packet["events"]["y"]
-                        return packet["events"]
-            elif self.type == TYPE_RAW:
-                return self.inner.__next__()
-            else:
-                raise Exception(f"type {self.type} not implemented")
+            return self.next()
         except StopIteration as exception:
             self.close()
             raise exception
 
-    def __exit__(
-        self,
-        exception_type: typing.Optional[typing.Type[BaseException]],
-        value: typing.Optional[BaseException],
-        traceback: typing.Optional[types.TracebackType],
-    ) -> bool:
-        assert self.decoder is not None
-        if self.type == TYPE_ES:
-            result = self.decoder.__exit__(exception_type, value, traceback)
-        else:
-            result = False
-        self.decoder = None
-        return result
+    def next_batch(self) -> numpy.ndarray:
+        packets: typing.List[numpy.ndarray] = []
+        length = 0
+        while length < self.batch_size:
+            try:
+                events = self.next_unbatched()
+            except StopIteration as exception:
+                if length == 0:
+                    raise exception
+                break
+            packets.append(events)
+            length += len(events)
+        if len(packets) == 1:
+            return packets[0]
+        return numpy.concatenate(packets)
+
+    def next_packet(self) -> numpy.ndarray:
+        return self.packets.__next__()
+
+    def next_es(self) -> numpy.ndarray:
+        while True:
+            events = self.packets.__next__().get("events")
+            if events is not None and len(events) > 0:
+                return events
+
+    def next_aedat(self) -> numpy.ndarray:
+        while True:
+            packet = self.packets.__next__()
+            if packet["stream_id"] != self.stream_id:
+                continue
+            events = packet.get("events")
+            if events is not None and len(events) > 0:
+                y = events["y"]
+                numpy.subtract(self.y_max, y, out=y)
+                return events
 
     def close(self):
         if self.inner is not None:
-            if self.type == TYPE_ES:
-                self.inner.__exit__(None, None, None)  # type: ignore
+            self.packets.close()
             self.inner = None
 
 
@@ -74,53 +150,54 @@ class Decoder(stream.Stream):
     Args:
         path (pathlib.Path): Path of the input event file.
         stream_id (typing.Optional[int], optional): Stream ID, only used with aedat files. Defaults to None.
+        batch_size (int, optional): Minimum number of events per yielded array, decoded packets are concatenated until it is reached (0 yields packets as decoded). Defaults to 0.
+        prefetch (int, optional): Maximum number of packets decoded ahead of the consumer by each iterator's background thread. Defaults to 2.
 
     Raises:
         Exception: _description_
         Exception: _description_
         Exception: _description_
     """
-    def __init__(self, path: pathlib.Path, stream_id: typing.Optional[int] = None):
+    def __init__(
+        self,
+        path: pathlib.Path,
+        stream_id: typing.Optional[int] = None,
+        batch_size: int = 0,
+        prefetch: int = 2,
+    ):
         super().__init__()
+        assert prefetch > 0
         self.path = path
         self.stream_id = stream_id
-        if path.suffix == ".es":
-            self.type = TYPE_ES
-        elif path.suffix == ".aedat4":
-            self.type = TYPE_AEDAT
-        else:
-            with open(self.path, "rb") as file:
-                magic = file.read(12)
-            if magic == b"Event Stream":
-                self.type = TYPE_ES
-            elif magic == b"#!AER-DAT4.0":
-                self.type = TYPE_AEDAT
-            else:
+        self.batch_size = batch_size
+        self.prefetch = prefetch
+        type = SUFFIX_TO_TYPE.get(path.suffix)
+        if type is None:
+            type = MAGIC_TO_TYPE.get(read_header(self.path, LONGEST_MAGIC))
+            if type is None:
                 raise Exception(f"unsupported file {self.path}")
+        self.type = type
         self.inner_width: int
         self.inner_height: int
         if self.type == TYPE_ES:
-            with event_stream.Decoder(self.path) as decoder:  # @TODO lower level
-                assert decoder.type == "dvs"
-                self.stream_width = decoder.width
-                self.stream_height = decoder.height
+            self.inner_width, self.inner_height = probe_event_stream_header(self.path)
         elif self.type == TYPE_AEDAT:
-            with aedat.Decoder(self.path) as decoder:  # @TODO lower level
-                found = False
-                if stream_id is None:
-                    for stream in decoder.id_to_stream().values():
-                        if stream["type"] == "events":
-                            self.stream_width = stream["width"]
-                            self.stream_height = stream["height"]
-                            found = True
-                            break
-                    if not found:
-                        raise Exception(f"the file {self.path} contains no events")
-                else:
-                    stream = decoder.id_to_stream()[stream_id]
-                    assert stream["type"] == "events"
-                    self.stream_width = stream["width"]
-                    self.stream_height = stream["height"]
+            decoder = aedat.Decoder(self.path)  # @TODO lower level
+            found = False
+            if stream_id is None:
+                for stream in decoder.id_to_stream().values():
+                    if stream["type"] == "events":
+                        self.inner_width = stream["width"]
+                        self.inner_height = stream["height"]
+                        found = True
+                        break
+                if not found:
+                    raise Exception(f"the file {self.path} contains no events")
+            else:
+                stream = decoder.id_to_stream()[stream_id]
+                assert stream["type"] == "events"
+                self.inner_width = stream["width"]
+                self.inner_height = stream["height"]
         elif self.type == TYPE_RAW:
             pass  # @TODO
         else:
@@ -146,4 +223,6 @@ class Decoder(stream.Stream):
             stream_id=self.stream_id,
             height=self.inner_height,
             inner=inner,
+            batch_size=self.batch_size,
+            prefetch=self.prefetch,
         )
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import typing
+
+import numpy
+
+from . import stream
+
+
+def flip_left_right(
+    events: numpy.ndarray, width: int, height: int, scratch: numpy.ndarray
+):
+    x = events["x"]
+    numpy.subtract(width - 1, x, out=x)
+
+
+def flip_bottom_top(
+    events: numpy.ndarray, width: int, height: int, scratch: numpy.ndarray
+):
+    y = events["y"]
+    numpy.subtract(height - 1, y, out=y)
+
+
+def rotate_90_counterclockwise(
+    events: numpy.ndarray, width: int, height: int, scratch: numpy.ndarray
+):
+    numpy.copyto(scratch, events["x"])
+    numpy.subtract(height - 1, events["y"], out=events["x"])
+    events["y"] = scratch
+
+
+def rotate_180(events: numpy.ndarray, width: int, height: int, scratch: numpy.ndarray):
+    flip_left_right(events, width, height, scratch)
+    flip_bottom_top(events, width, height, scratch)
+
+
+def rotate_270_counterclockwise(
+    events: numpy.ndarray, width: int, height: int, scratch: numpy.ndarray
+):
+    numpy.copyto(scratch, events["y"])
+    numpy.subtract(width - 1, events["x"], out=events["y"])
+    events["x"] = scratch
+
+
+def flip_up_diagonal(
+    events: numpy.ndarray, width: int, height: int, scratch: numpy.ndarray
+):
+    numpy.copyto(scratch, events["x"])
+    events["x"] = events["y"]
+    events["y"] = scratch
+
+
+def flip_down_diagonal(
+    events: numpy.ndarray, width: int, height: int, scratch: numpy.ndarray
+):
+    numpy.copyto(scratch, events["x"])
+    numpy.subtract(height - 1, events["y"], out=events["x"])
+    numpy.subtract(width - 1, scratch, out=events["y"])
+
+
+TransposeFunction = typing.Callable[[numpy.ndarray, int, int, numpy.ndarray], None]
+
+TRANSPOSE_TO_FUNCTION: dict[stream.Transpose, TransposeFunction] = {
+    stream.Transpose.FLIP_LEFT_RIGHT: flip_left_right,
+    stream.Transpose.FLIP_BOTTOM_TOP: flip_bottom_top,
+    stream.Transpose.ROTATE_90_COUNTERCLOCKWISE: rotate_90_counterclockwise,
+    stream.Transpose.ROTATE_180: rotate_180,
+    stream.Transpose.ROTATE_270_COUNTERCLOCKWISE: rotate_270_counterclockwise,
+    stream.Transpose.FLIP_UP_DIAGONAL: flip_up_diagonal,
+    stream.Transpose.FLIP_DOWN_DIAGONAL: flip_down_diagonal,
+}
+
+SWAP_DIMENSIONS: set[stream.Transpose] = {
+    stream.Transpose.ROTATE_90_COUNTERCLOCKWISE,
+    stream.Transpose.ROTATE_270_COUNTERCLOCKWISE,
+    stream.Transpose.FLIP_UP_DIAGONAL,
+    stream.Transpose.FLIP_DOWN_DIAGONAL,
+}
+
+
+class TransposeIterator(stream.FilterIterator):
+    def __init__(
+        self,
+        parent: stream.StreamIterator,
+        apply: TransposeFunction,
+        dimensions: tuple[int, int],
+        swap: bool,
+    ):
+        super().__init__(parent=parent)
+        self.apply = apply
+        self.dimensions = dimensions
+        self.swap = swap
+        self.scratch = numpy.empty(0, dtype=numpy.uint16)
+
+    def __next__(self) -> numpy.ndarray:
+        events = stream.writeable(self.parent.__next__())
+        if self.swap and len(self.scratch) < len(events):
+            self.scratch = numpy.empty(
+                max(len(events), len(self.scratch) * 2), dtype=events["x"].dtype
+            )
+        self.apply(
+            events,
+            self.dimensions[0],
+            self.dimensions[1],
+            self.scratch[: len(events)],
+        )
+        return events
+
+
+class Transpose(stream.Filter):
+    def __init__(self, parent: stream.Stream, action: stream.Transpose):
+        super().__init__(parent=parent)
+        if action not in TRANSPOSE_TO_FUNCTION:
+            raise Exception(f"unsupported transpose action {action}")
+        self.action = action
+        self.apply = TRANSPOSE_TO_FUNCTION[action]
+        self.swap = action in SWAP_DIMENSIONS
+        self.parent_dimensions = (parent.width(), parent.height())
+
+    def time_slice(
+        self,
+        start: int,
+        end: int,
+        zero: typing.Optional[typing.Union[stream.TimestampOffset, str]] = None,
+    ) -> stream.Stream:
+        return self.parent.time_slice(start=start, end=end, zero=zero).transpose(
+            self.action
+        )
+
+    def event_slice(
+        self, start: int, end: int, zero_first: bool = False
+    ) -> stream.Stream:
+        return self.parent.event_slice(
+            start=start, end=end, zero_first=zero_first
+        ).transpose(self.action)
+
+    def width(self) -> int:
+        return self.parent_dimensions[1 if self.swap else 0]
+
+    def height(self) -> int:
+        return self.parent_dimensions[0 if self.swap else 1]
+
+    def __iter__(self) -> stream.StreamIterator:
+        return TransposeIterator(
+            parent=iter(self.parent),
+            apply=self.apply,
+            dimensions=self.parent_dimensions,
+            swap=self.swap,
+        )
+
+
+class TimeSliceIterator(stream.FilterIterator):
+    def __init__(
+        self,
+        parent: stream.StreamIterator,
+        start: int,
+        end: int,
+        zero: typing.Optional[stream.TimestampOffset],
+    ):
+        super().__init__(parent=parent)
+        self.start = start
+        self.end = end
+        self.zero = zero
+        self.offset: typing.Optional[int] = (
+            start if zero == stream.TimestampOffset.START else None
+        )
+        self.done = False
+
+    def __next__(self) -> numpy.ndarray:
+        while True:
+            if self.done:
+                self.close()
+                raise StopIteration()
+            events = self.parent.__next__()
+            if len(events) == 0:
+                continue
+            t = events["t"]
+            if t[0] < self.start or t[-1] >= self.end:
+                begin = numpy.searchsorted(t, self.start)
+                if begin == len(t):
+                    continue
+                end = numpy.searchsorted(t, self.end)
+                if end == begin:
+                    self.close()
+                    raise StopIteration()
+                self.done = end < len(t)
+                events = events[begin:end]
+            if self.zero == stream.TimestampOffset.FIRST and self.offset is None:
+                self.offset = int(events["t"][0])
+            if self.offset is not None:
+                events = stream.writeable(events)
+                t = events["t"]
+                numpy.subtract(t, self.offset, out=t)
+            return events
+
+
+class TimeSlice(stream.Filter):
+    def __init__(
+        self,
+        parent: stream.Stream,
+        start: int,
+        end: int,
+        zero: typing.Optional[stream.TimestampOffset],
+    ):
+        super().__init__(parent=parent)
+        assert start < end
+        self.start = int(start)
+        self.end = int(end)
+        self.zero = zero
+
+    def __iter__(self) -> stream.StreamIterator:
+        return TimeSliceIterator(
+            parent=iter(self.parent),
+            start=self.start,
+            end=self.end,
+            zero=self.zero,
+        )
+
+
+class EventSliceIterator(stream.FilterIterator):
+    def __init__(
+        self,
+        parent: stream.StreamIterator,
+        start: int,
+        end: int,
+        zero_first: bool,
+    ):
+        super().__init__(parent=parent)
+        self.start = start
+        self.end = end
+        self.zero_first = zero_first
+        self.index = 0
+        self.offset: typing.Optional[int] = None
+
+    def __next__(self) -> numpy.ndarray:
+        while True:
+            if self.index >= self.end:
+                self.close()
+                raise StopIteration()
+            events = self.parent.__next__()
+            length = len(events)
+            if length == 0:
+                continue
+            index = self.index
+            self.index += length
+            if self.index <= self.start:
+                continue
+            if index < self.start or self.index > self.end:
+                events = events[max(self.start - index, 0) : self.end - index]
+            if self.zero_first:
+                if self.offset is None:
+                    self.offset = int(events["t"][0])
+                events = stream.writeable(events)
+                t = events["t"]
+                numpy.subtract(t, self.offset, out=t)
+            return events
+
+
+class EventSlice(stream.Filter):
+    def __init__(
+        self,
+        parent: stream.Stream,
+        start: int,
+        end: int,
+        zero_first: bool,
+    ):
+        super().__init__(parent=parent)
+        assert start < end
+        self.start = int(start)
+        self.end = int(end)
+        self.zero_first = zero_first
+
+    def __iter__(self) -> stream.StreamIterator:
+        return EventSliceIterator(
+            parent=iter(self.parent),
+            start=self.start,
+            end=self.end,
+            zero_first=self.zero_first,
+        )
+
+
+class PrefetchFilterIterator(stream.FilterIterator):
+    def __init__(self, parent: stream.StreamIterator, maxsize: int):
+        super().__init__(parent=parent)
+        self.batches: typing.Optional[stream.PrefetchIterator] = (
+            stream.PrefetchIterator(parent, maxsize=maxsize)
+        )
+
+    def __next__(self) -> numpy.ndarray:
+        if self.batches is None:
+            raise StopIteration()
+        return self.batches.__next__()
+
+    def close(self):
+        if self.batches is not None:
+            self.batches.close()
+            self.batches = None
+            self.parent.close()
+
+
+class Prefetch(stream.Filter):
+    def __init__(self, parent: stream.Stream, maxsize: int):
+        super().__init__(parent=parent)
+        self.maxsize = maxsize
+
+    def __iter__(self) -> stream.StreamIterator:
+        return PrefetchFilterIterator(parent=iter(self.parent), maxsize=self.maxsize)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import collections
 import dataclasses
 import enum
+import queue
+import threading
 import types
 import typing
+import weakref
 
 import numpy
 
@@ -39,7 +43,20 @@ class Box:
         return cls(left=box[0], bottom=box[1], right=box[2], top=box[3])
 
 
+def writeable(events: numpy.ndarray) -> numpy.ndarray:
+    """Returns events if they may be modified in place, and a copy otherwise."""
+    if events.flags.writeable:
+        return events
+    return events.copy()
+
+
 class StreamIterator:
+    """Iterates over the event batches of a stream.
+
+    Timestamps are monotonically non-decreasing, within each batch and across batches.
+    Filters (for instance time slices) rely on this to locate events with binary searches.
+    """
+
     def __iter__(self):
         return self
 
@@ -50,6 +67,76 @@ class StreamIterator:
         raise NotImplementedError()
 
 
+PREFETCH_POLL_INTERVAL: float = 0.1
+
+
+def prefetch_put(items: queue.Queue, item: typing.Any, stop: threading.Event) -> bool:
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=PREFETCH_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def prefetch_worker(inner: typing.Iterator, items: queue.Queue, stop: threading.Event):
+    try:
+        while not stop.is_set():
+            if not prefetch_put(items, (inner.__next__(), None), stop):
+                return
+    except BaseException as exception:
+        prefetch_put(items, (None, exception), stop)
+
+
+class PrefetchIterator:
+    """Consumes an iterator on a background thread.
+
+    Up to maxsize items are decoded ahead of the consumer, so that work that releases the GIL
+    (for instance the Rust decoders) overlaps with Python-side processing.
+    The worker thread does not reference the PrefetchIterator. It stops when close() is called
+    or when the PrefetchIterator is garbage-collected, and then releases the inner iterator.
+    close() does not close the inner iterator.
+
+    Args:
+        inner (typing.Iterator): Iterator to consume on the background thread.
+        maxsize (int, optional): Maximum number of buffered items. Defaults to 2.
+    """
+
+    def __init__(self, inner: typing.Iterator, maxsize: int = 2):
+        assert maxsize > 0
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.exception: typing.Optional[BaseException] = None
+        self.stop = threading.Event()
+        self.thread = threading.Thread(
+            target=prefetch_worker, args=(inner, self.queue, self.stop), daemon=True
+        )
+        self.thread.start()
+        weakref.finalize(self, self.stop.set)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> typing.Any:
+        if self.stop.is_set():
+            raise StopIteration()
+        if self.exception is None:
+            item, self.exception = self.queue.get()
+            if self.exception is None:
+                return item
+        raise self.exception
+
+    def close(self):
+        if not self.stop.is_set():
+            self.stop.set()
+            self.thread.join()
+            while True:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    break
+
+
 class Stream:
     def width(self) -> int:
         raise NotImplementedError()
@@ -77,12 +164,16 @@ class Stream:
         end: int,
         zero: typing.Optional[typing.Union[TimestampOffset, str]] = None,
     ) -> "Stream":
-        # @TODO
-        pass
+        from .filter import TimeSlice
+
+        if isinstance(zero, str):
+            zero = TimestampOffset(zero)
+        return TimeSlice(parent=self, start=start, end=end, zero=zero)
 
     def event_slice(self, start: int, end: int, zero_first: bool = False) -> "Stream":
-        # @TODO
-        pass
+        from .filter import EventSlice
+
+        return EventSlice(parent=self, start=start, end=end, zero_first=zero_first)
 
     def crop(
         self,
@@ -94,12 +185,55 @@ class Stream:
         # @TODO
         pass
 
-    def transpose(self, action: Transpose) -> "Stream":
-        # @TODO
-        pass
-
-    def to_array(self) -> numpy.ndarray:
-        return numpy.concatenate(list(self))
+    def transpose(self, action: typing.Union[Transpose, str]) -> "Stream":
+        from .filter import Transpose as TransposeFilter
+
+        if isinstance(action, str):
+            action = Transpose(action)
+        return TransposeFilter(parent=self, action=action)
+
+    def prefetch(self, maxsize: int = 4) -> "Stream":
+        """Computes the stream's batches on a background thread.
+
+        This lets the stages before prefetch (for instance decoding and slicing) run while the
+        stages after it process the previous batches.
+
+        Args:
+            maxsize (int, optional): Maximum number of batches computed ahead. Defaults to 4.
+        """
+        from .filter import Prefetch
+
+        return Prefetch(parent=self, maxsize=maxsize)
+
+    def to_array(self, length_hint: int = 0) -> numpy.ndarray:
+        """Concatenates the stream's batches into a single array.
+
+        Batches are copied into the output as they are produced instead of being kept until the
+        end. If the stream is longer than length_hint, the output is doubled (in place when the
+        allocator permits), so the buffer may reach about twice the output's size before the
+        final trim. A reallocation that cannot be done in place briefly holds the old buffer as
+        well. Passing the expected length as length_hint avoids both.
+
+        Args:
+            length_hint (int, optional): Expected number of events. Defaults to 0.
+
+        Returns:
+            numpy.ndarray: All the events of the stream.
+        """
+        events: typing.Optional[numpy.ndarray] = None
+        length = 0
+        for batch in self:
+            if events is None:
+                events = numpy.empty(max(length_hint, len(batch)), dtype=batch.dtype)
+            elif length + len(batch) > len(events):
+                events.resize(max(length + len(batch), len(events) * 2), refcheck=False)
+            events[length : length + len(batch)] = batch
+            length += len(batch)
+        if events is None:
+            return numpy.zeros(0, dtype=DVS_DTYPE)
+        if length < len(events):
+            events.resize(length, refcheck=False)
+        return events
 
 
 class ArrayIterator(StreamIterator):
@@ -119,11 +253,130 @@ class ArrayIterator(StreamIterator):
 
 
 class Array(Stream):
+    """A stream backed by an in-memory array.
+
+    Iterators yield a read-only view of the array instead of a copy. Filters that modify
+    events in place call writeable first, so only the events they actually modify are copied.
+
+    Args:
+        events (numpy.ndarray): Events, they are not copied.
+    """
+
     def __init__(self, events: numpy.ndarray):
         self.events = events
 
     def __iter__(self) -> StreamIterator:
-        return ArrayIterator(self.events.copy())
+        events = self.events.view()
+        events.flags.writeable = False
+        return ArrayIterator(events)
+
+
+class ChainIterator(StreamIterator):
+    def __init__(
+        self, streams: typing.Sequence[Stream], lookahead: int, offset_timestamps: bool
+    ):
+        super().__init__()
+        self.streams = iter(streams)
+        self.iterators: collections.deque[StreamIterator] = collections.deque()
+        self.offset_timestamps = offset_timestamps
+        self.offset: typing.Optional[int] = None
+        self.previous_t: typing.Optional[int] = None
+        for _ in range(lookahead):
+            self.open_next()
+
+    def open_next(self):
+        stream = next(self.streams, None)
+        if stream is not None:
+            self.iterators.append(iter(stream))
+
+    def __next__(self) -> numpy.ndarray:
+        while len(self.iterators) > 0:
+            try:
+                events = self.iterators[0].__next__()
+            except StopIteration:
+                self.iterators.popleft().close()
+                self.open_next()
+                self.offset = None
+                continue
+            if len(events) > 0:
+                if self.offset_timestamps:
+                    if self.offset is None:
+                        self.offset = (
+                            0
+                            if self.previous_t is None
+                            else self.previous_t - int(events["t"][0])
+                        )
+                    if self.offset != 0:
+                        events = writeable(events)
+                        t = events["t"]
+                        if self.offset > 0:
+                            numpy.add(t, self.offset, out=t)
+                        else:
+                            numpy.subtract(t, -self.offset, out=t)
+                t = events["t"]
+                if self.previous_t is not None and t[0] < self.previous_t:
+                    self.close()
+                    raise Exception(
+                        f"chained timestamps decrease ({t[0]} < {self.previous_t}),"
+                        " use offset_timestamps to rebase each stream"
+                    )
+                self.previous_t = int(t[-1])
+            return events
+        raise StopIteration()
+
+    def close(self):
+        for iterator in self.iterators:
+            iterator.close()
+        self.iterators.clear()
+
+
+class Chain(Stream):
+    """Concatenates streams that share the same dimensions.
+
+    By default, timestamps are not offset, so each stream must start at or after the
+    last timestamp of the previous one (iterating raises an exception otherwise).
+    Streams recorded separately usually restart at zero. With offset_timestamps, each
+    stream is shifted so that its first event has the last timestamp of the previous
+    stream.
+
+    Up to lookahead streams are iterated at once. Iterators that work in the background,
+    such as decoder iterators (which decode up to their prefetch depth on their own
+    thread and release the GIL), thus process the next files while the current one is
+    consumed. Chain does not buffer batches itself.
+
+    Args:
+        streams (typing.Sequence[Stream]): Streams to concatenate, in order.
+        lookahead (int, optional): Number of streams iterated concurrently. Defaults to 1.
+        offset_timestamps (bool, optional): Rebase each stream onto the previous stream's last timestamp. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        streams: typing.Sequence[Stream],
+        lookahead: int = 1,
+        offset_timestamps: bool = False,
+    ):
+        assert len(streams) > 0
+        assert lookahead > 0
+        for stream in streams[1:]:
+            assert stream.width() == streams[0].width()
+            assert stream.height() == streams[0].height()
+        self.streams = streams
+        self.lookahead = lookahead
+        self.offset_timestamps = offset_timestamps
+
+    def width(self) -> int:
+        return self.streams[0].width()
+
+    def height(self) -> int:
+        return self.streams[0].height()
+
+    def __iter__(self) -> StreamIterator:
+        return ChainIterator(
+            streams=self.streams,
+            lookahead=self.lookahead,
+            offset_timestamps=self.offset_timestamps,
+        )
 
 
 class FilterIterator(StreamIterator):
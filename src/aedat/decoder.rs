@@ -66,6 +66,7 @@ pub(crate) mod imus_generated;
 pub(crate) mod triggers_generated;
 
 const MAGIC_NUMBER: &str = "#!AER-DAT4.0\r\n";
+const BUFFER_SIZE: usize = 262144;
 
 #[derive(thiserror::Error, Debug)]
 pub enum Error {
@@ -177,7 +178,7 @@ pub struct Stream {
 
 pub struct Decoder {
     pub id_to_stream: std::collections::HashMap<u32, Stream>,
-    file: std::fs::File,
+    file: std::io::BufReader<std::fs::File>,
     position: i64,
     compression: ioheader_generated::Compression,
     file_data_position: i64,
@@ -189,7 +190,7 @@ impl Decoder {
     pub fn new<P: AsRef<std::path::Path>>(path: P) -> Result<Self, Error> {
         let mut decoder = Decoder {
             id_to_stream: std::collections::HashMap::new(),
-            file: std::fs::File::open(path)?,
+            file: std::io::BufReader::with_capacity(BUFFER_SIZE, std::fs::File::open(path)?),
             position: 0i64,
             file_data_position: 0,
             compression: ioheader_generated::Compression::None,
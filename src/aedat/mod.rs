@@ -67,7 +67,9 @@ impl Decoder {
     }
 
     fn __next__(mut shell: pyo3::PyRefMut<Self>) -> PyResult<Option<PyObject>> {
-        let packet = match shell.decoder.next() {
+        let python = shell.py();
+        let decoder = &mut shell.decoder;
+        let packet = match python.allow_threads(|| decoder.next()) {
             Ok(result) => match result {
                 Some(result) => result,
                 None => return Ok(None),